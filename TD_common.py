@@ -0,0 +1,269 @@
+# Shared settings, state and storage for the Task Displayer
+# Only uses the standard library so every mode can import it without pulling in PyQt5 or Flask
+
+import time
+
+# Reference point for the startup timeline, taken as early as possible
+STARTUP_T0 = time.perf_counter()
+
+import os, re, json, queue, sqlite3, threading
+from contextlib import contextmanager
+import logging
+# Setup logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger('task_displayer')
+
+# Define priority order for sorting
+PRIORITY_ORDER = {'High': 3, 'Medium': 2, 'Low': 1}
+
+# Color mapping for priorities (used in the display)
+PRIORITY_COLORS = {'High': '#d32f2f', 'Medium': '#ff9800', 'Low': '#388e3c'}
+
+# Color mapping for tunnel states (used in the display)
+TUNNEL_STATUS_COLORS = {'online': '#388e3c', 'starting': '#ff9800', 'waiting': '#6b6f76', 'restarting': '#d32f2f', 'stopped': '#6b6f76'}
+
+# Timestamp font size (change this number to adjust timestamp size in both GUI and web UI)
+TIMESTAMP_FONT_SIZE = 32  # px
+
+# Separate font size for completed tasks history window
+COMPLETED_TASKS_FONT_SIZE = 16  # px
+
+# Port the Flask server listens on (the tunnel forwards to this)
+FLASK_PORT = 5000
+
+# Path to the cloudflared executable (replace with the path to your Cloudflare, or set the CLOUDFLARED_PATH environment variable)
+CLOUDFLARED_PATH = os.environ.get('CLOUDFLARED_PATH', r'C:\Users\lucas\OneDrive\Desktop\codes\Python\Cloudflare\cloudflared-windows-amd64.exe')
+
+# Tunnel supervisor tuning (seconds)
+TUNNEL_BACKOFF_MIN = 1         # first restart delay, doubled after every failed attempt
+TUNNEL_BACKOFF_MAX = 60        # restart delay never grows past this
+TUNNEL_STABLE_AFTER = 120      # a tunnel that stayed up this long resets the backoff
+TUNNEL_HEALTH_INTERVAL = 10    # time between health checks of the public URL
+TUNNEL_HEALTH_GRACE = 20       # time a fresh quick-tunnel gets to print its URL and become reachable before it is checked
+TUNNEL_HEALTH_FAILURES = 3     # consecutive failed checks before the tunnel is restarted
+
+# Set once the Flask server is bound to its port, the tunnel waits on this instead of polling
+flask_ready = threading.Event()
+
+# Startup timeline: milliseconds since STARTUP_T0 for each startup step (import, db_open, flask_bound, first_paint)
+startup_timeline = {}
+_timeline_lock = threading.Lock()
+
+
+def startup_mark(event):
+    # Record a startup step (only the first time it happens) and log the timeline so far
+    with _timeline_lock:
+        if event in startup_timeline:
+            return
+        startup_timeline[event] = (time.perf_counter() - STARTUP_T0) * 1000
+        summary = ', '.join(f"{name}={ms:.0f}ms" for name, ms in startup_timeline.items())
+    logger.info(f"Startup timeline: {summary}")
+
+
+# Boards (one task list per department), each with its own SQLite file.
+# Set the TD_BOARDS environment variable (or use --boards) to a comma separated list, e.g. "dock,maintenance,front-desk".
+# The first board is the default one, served at the old URLs ("/", "/tasks", ...). All boards are served at "/b/<board>/...".
+BOARDS = [name.strip() for name in os.environ.get('TD_BOARDS', 'main').split(',') if name.strip()]
+
+# The "main" board keeps using the original tasks.db, every other board gets its own file in this folder
+LEGACY_BOARD = 'main'
+BOARDS_DIR = 'boards'
+
+# Allowed board names (they end up in URLs and file names)
+BOARD_NAME_PATTERN = re.compile(r'^[a-z0-9][a-z0-9_-]{0,31}$')
+
+# Seconds each board stays on screen when a display rotates through several boards
+BOARD_ROTATE_SECONDS = 30
+
+# Seconds between attempts to open a board's database after opening it failed
+DB_RETRY_SECONDS = 10
+
+# Maximum number of SQLite connections kept open per board
+DB_POOL_SIZE = 4
+
+# Bump this whenever migrate() learns a new schema change, older databases are then upgraded once on open
+SCHEMA_VERSION = 1
+
+
+def migrate(conn):
+    # Schema checks only run when the version stored in the database is behind SCHEMA_VERSION
+    version = conn.execute('PRAGMA user_version').fetchone()[0]
+    if version >= SCHEMA_VERSION:
+        return
+
+    # Create initial table structure if it doesn't exist
+    conn.execute('''CREATE TABLE IF NOT EXISTS tasks (
+        name TEXT,
+        priority TEXT,
+        displayed INTEGER DEFAULT 0,
+        timestamp TEXT,
+        completed INTEGER DEFAULT 0,
+        completed_at TEXT
+    )''')
+
+    # If upgrading from older version, ensure all columns exist
+    cursor = conn.execute("PRAGMA table_info(tasks)")
+    cols = [row[1] for row in cursor]
+
+    # Add any missing columns
+    if 'timestamp' not in cols:
+        conn.execute('ALTER TABLE tasks ADD COLUMN timestamp TEXT')
+    if 'completed' not in cols:
+        conn.execute('ALTER TABLE tasks ADD COLUMN completed INTEGER DEFAULT 0')
+    if 'completed_at' not in cols:
+        conn.execute('ALTER TABLE tasks ADD COLUMN completed_at TEXT')
+    if 'confirm_number' not in cols:
+        conn.execute('ALTER TABLE tasks ADD COLUMN confirm_number INTEGER')
+    conn.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+    conn.commit()
+    logger.info(f"Database schema upgraded from version {version} to {SCHEMA_VERSION}")
+
+
+class Board:
+    """One task board: its own SQLite file, connection pool and display cache."""
+
+    def __init__(self, name):
+        self.name = name
+        if name == LEGACY_BOARD:
+            self.db_path = 'tasks.db'
+            # Last rendered task list, so the display can show something before the database is open
+            self.cache_path = 'display_cache.json'
+        else:
+            self.db_path = os.path.join(BOARDS_DIR, f'{name}.db')
+            self.cache_path = os.path.join(BOARDS_DIR, f'{name}.display_cache.json')
+        # Set once the database has been opened and migrated
+        self.ready = threading.Event()
+        # Why the last attempt to open the database failed (None if it did not)
+        self.open_error = None
+        self._open_thread = None
+        self._open_thread_lock = threading.Lock()
+        self._pool = queue.LifoQueue()
+        self._pool_lock = threading.Lock()
+        self._open_connections = 0
+        # Separate connection for the display, see display_connection()
+        self._display_conn = None
+
+    def _connect(self):
+        if os.path.dirname(self.db_path):
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=10)
+        # WAL lets the display read while the web interface writes to the same board
+        conn.execute('PRAGMA journal_mode=WAL')
+        return conn
+
+    def open(self):
+        # Open (and if needed migrate) the database on first use instead of at import time
+        if self.ready.is_set():
+            return
+        with self._pool_lock:
+            if self.ready.is_set():
+                return
+            conn = self._connect()
+            try:
+                migrate(conn)
+            except Exception:
+                conn.close()
+                raise
+            self._open_connections += 1
+            self._pool.put(conn)
+            self.ready.set()
+        startup_mark('db_open')
+
+    def try_open(self):
+        # Like open(), but logs and remembers the error instead of raising it (for background threads)
+        try:
+            self.open()
+        except Exception as e:
+            logger.error(f"Failed to open the database of board '{self.name}': {e}")
+            self.open_error = str(e)
+            return False
+        self.open_error = None
+        return True
+
+    def open_in_background(self):
+        # Try to open the database in a background thread, unless an attempt is still running
+        with self._open_thread_lock:
+            if self.ready.is_set() or (self._open_thread and self._open_thread.is_alive()):
+                return
+            self._open_thread = threading.Thread(target=self.try_open, name=f'open-{self.name}', daemon=True)
+            self._open_thread.start()
+
+    def acquire(self):
+        # Borrow a connection from this board's pool, at most DB_POOL_SIZE are open at once
+        self.open()
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        with self._pool_lock:
+            can_open = self._open_connections < DB_POOL_SIZE
+            if can_open:
+                self._open_connections += 1
+        if not can_open:
+            return self._pool.get()
+        try:
+            return self._connect()
+        except Exception:
+            with self._pool_lock:
+                self._open_connections -= 1
+            raise
+
+    def release(self, conn):
+        self._pool.put(conn)
+
+    @contextmanager
+    def display_connection(self):
+        # The display's own connection, outside the pool, so web requests holding every pooled connection never freeze the GUI.
+        # Only used from the GUI thread.
+        self.open()
+        if self._display_conn is None:
+            self._display_conn = self._connect()
+        try:
+            yield self._display_conn
+        except Exception:
+            self._display_conn.rollback()
+            raise
+
+    def load_display_cache(self):
+        try:
+            with open(self.cache_path, encoding='utf-8') as f:
+                tasks = json.load(f)
+        except (OSError, ValueError):
+            return []
+        return tasks if isinstance(tasks, list) else []
+
+    def save_display_cache(self, tasks):
+        # Write to a temporary file first so a power cut never leaves a half written cache behind
+        tmp_path = self.cache_path + '.tmp'
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(tasks, f)
+            os.replace(tmp_path, self.cache_path)
+        except OSError as e:
+            logger.warning(f"Failed to write display cache for board '{self.name}': {e}")
+
+
+_boards = {}
+
+
+def configure_boards(names):
+    # Set up the known boards (nothing is opened yet), raises ValueError for invalid or missing names
+    names = [name.strip().lower() for name in names if name.strip()]
+    if not names:
+        raise ValueError("At least one board is required")
+    for name in names:
+        if not BOARD_NAME_PATTERN.match(name):
+            raise ValueError(f"Invalid board name '{name}' (use lowercase letters, digits, '-' and '_', max 32 characters)")
+    # Updated in place so modules that imported BOARDS see the change
+    BOARDS[:] = dict.fromkeys(names)
+    _boards.clear()
+    _boards.update((name, Board(name)) for name in BOARDS)
+
+
+def get_board(name=None):
+    # Board by name (the default board if no name is given), None if there is no such board
+    if not _boards:
+        configure_boards(BOARDS)
+    if name is None:
+        name = BOARDS[0]
+    return _boards.get(name)
@@ -3,7 +3,7 @@ COMPLETED_LIST = '''
 <html>
 <head>
     <meta name="viewport" content="width=device-width, initial-scale=1">
-    <title>Completed Tasks</title>
+    <title>Completed Tasks{% if board_label %} - {{ board_label }}{% endif %}</title>
     <style>
         :root{--bg:#f7f8fb;--card:#fff;--accent:#1976d2;--muted:#6b6f76}
         *{box-sizing:border-box}
@@ -25,8 +25,8 @@ COMPLETED_LIST = '''
 <body>
     <div class="wrap">
         <header>
-            <a href="/tasks" style="text-decoration:none"><button class="btn link-btn">Back</button></a>
-            <h1>Completed Tasks</h1>
+            <a href="{{ base }}/tasks" style="text-decoration:none"><button class="btn link-btn">Back</button></a>
+            <h1>Completed Tasks{% if board_label %} ({{ board_label }}){% endif %}</h1>
         </header>
         <div class="card">
             {% if tasks %}
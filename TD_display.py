@@ -0,0 +1,364 @@
+# PyQt5 display window for the big screen
+# Imported lazily by the main script, only in the modes that show the display
+
+import datetime, time
+import html  # for escaping HTML in task names
+from PyQt5 import QtWidgets, QtCore, QtGui
+from TD_common import (startup_mark, BOARDS, BOARD_ROTATE_SECONDS, DB_RETRY_SECONDS, PRIORITY_ORDER, PRIORITY_COLORS,
+                       TUNNEL_STATUS_COLORS, TIMESTAMP_FONT_SIZE, COMPLETED_TASKS_FONT_SIZE)
+from TD_tunnel import tunnel
+
+
+# PyQt display window
+class DisplayWindow(QtWidgets.QWidget):
+    # Emitted once, right after the window has been painted for the first time
+    first_painted = QtCore.pyqtSignal()
+
+    def __init__(self, boards, rotate_seconds=BOARD_ROTATE_SECONDS, show_tunnel=True):
+        super().__init__()
+        # The display is bound to one board, or rotates through several
+        self.boards = boards
+        self.board_index = 0
+        self.board = boards[0]
+        self.show_tunnel = show_tunnel
+        self.painted = False
+        self.shown_tasks = None
+        # The database is first opened in the background by the main script, the display retries if that fails
+        self.last_open_attempt = time.monotonic()
+        self.setWindowTitle("Task Display")
+        self.resize(600, 400)
+
+        # Layout
+        self.layout = QtWidgets.QVBoxLayout(self)
+        
+        # DateTime display at the top
+        self.datetime_label = QtWidgets.QLabel(self)
+        self.datetime_label.setAlignment(QtCore.Qt.AlignCenter)
+        font = QtGui.QFont("Arial", 18)
+        self.datetime_label.setFont(font)
+        self.datetime_label.setStyleSheet("""
+            QLabel {
+                color: #333;
+                padding: 10px;
+                background: #f8f9fa;
+                border-radius: 5px;
+            }
+        """)
+        self.layout.addWidget(self.datetime_label)
+
+        # Remote entry (tunnel) status below the date and time
+        self.tunnel_label = QtWidgets.QLabel(self)
+        self.tunnel_label.setAlignment(QtCore.Qt.AlignCenter)
+        self.tunnel_label.setFont(QtGui.QFont("Arial", 12))
+        self.tunnel_label.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        self.tunnel_label.setVisible(show_tunnel)
+        self.layout.addWidget(self.tunnel_label)
+
+        # Separator line
+        separator = QtWidgets.QFrame(self)
+        separator.setFrameShape(QtWidgets.QFrame.HLine)
+        separator.setFrameShadow(QtWidgets.QFrame.Sunken)
+        separator.setStyleSheet("QFrame { background: #ccc; margin: 10px 0; }")
+        separator.setFixedHeight(2)
+        self.layout.addWidget(separator)
+
+        # Heading for tasks with a Completed History button
+        heading_container = QtWidgets.QWidget(self)
+        heading_layout = QtWidgets.QHBoxLayout(heading_container)
+        self.heading_label = QtWidgets.QLabel(self)
+        self.heading_label.setAlignment(QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter)
+        heading_font = QtGui.QFont("Arial", 23, QtGui.QFont.Bold)
+        self.heading_label.setFont(heading_font)
+        heading_layout.addWidget(self.heading_label)
+        # Shown while the tasks come from the cache because the database is not open (yet)
+        self.offline_label = QtWidgets.QLabel("Offline - showing saved tasks", self)
+        self.offline_label.setFont(QtGui.QFont("Arial", 14, QtGui.QFont.Bold))
+        self.offline_label.setStyleSheet("QLabel { color: #d32f2f; padding-left: 15px; }")
+        heading_layout.addWidget(self.offline_label)
+        # Spacer
+        heading_layout.addStretch()
+        history_btn = QtWidgets.QPushButton("Completed History", self)
+        history_btn.setFixedHeight(45)
+        history_btn.setMinimumWidth(180)
+        history_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #4a90e2;
+                color: white;
+                border: none;
+                border-radius: 6px;
+                padding: 8px 16px;
+                font-size: 15px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #357abd;
+            }
+            QPushButton:pressed {
+                background-color: #2d6da3;
+            }
+        """)
+        history_btn.clicked.connect(self.show_history_dialog)
+        heading_layout.addWidget(history_btn)
+        self.layout.addWidget(heading_container)
+        
+        # Task display widget
+        self.text_area = QtWidgets.QTextEdit(self)
+        self.text_area.setReadOnly(True)
+        # Allow HTML so we can color labels and add spacing
+        try:
+            self.text_area.setAcceptRichText(True)
+        except Exception:
+            # setAcceptRichText may not be available in some Qt bindings; ignore if so
+            pass
+        font = QtGui.QFont("Arial", 23)
+        self.text_area.setFont(font)
+        self.text_area.setStyleSheet("""
+            QTextEdit {
+                background-color: #ffffff;
+                border: 1px solid #ccc;
+                border-radius: 5px;
+                padding: 10px;
+                color: #333;
+            }
+        """)
+        self.layout.addWidget(self.text_area)
+
+        # Show the tasks from the last run right away, the database is opened in the background
+        self.update_heading()
+        self.render_tasks(self.board.load_display_cache())
+
+        # Timer to update display
+        self.timer = QtCore.QTimer(self)
+        self.timer.timeout.connect(self.update_display)
+        self.timer.start(1000)
+
+        # Timer to switch to the next board when rotating
+        if len(boards) > 1:
+            self.rotate_timer = QtCore.QTimer(self)
+            self.rotate_timer.timeout.connect(self.next_board)
+            self.rotate_timer.start(rotate_seconds * 1000)
+
+    def update_heading(self):
+        # Only name the board when there is more than one
+        if len(BOARDS) > 1:
+            self.heading_label.setText(f"To do ({self.board.name}):")
+        else:
+            self.heading_label.setText("To do:")
+
+    def next_board(self):
+        self.board_index = (self.board_index + 1) % len(self.boards)
+        self.board = self.boards[self.board_index]
+        self.update_heading()
+        self.render_tasks(self.board.load_display_cache())
+        self.update_display()
+
+    def update_display(self):
+        # Update datetime display
+        current_dt = QtCore.QDateTime.currentDateTime()
+        formatted_dt = current_dt.toString('dddd, MMMM d, yyyy - hh:mm:ss AP')
+        self.datetime_label.setText(formatted_dt)
+
+        # Update tunnel status
+        if self.show_tunnel:
+            self.update_tunnel_status()
+
+        # Keep showing the cached tasks until the database is open
+        if not self.board.ready.is_set():
+            self.offline_label.setVisible(True)
+            if self.board.open_error:
+                self.offline_label.setToolTip(self.board.open_error)
+            # Keep trying to open it, in the background so a locked database never freezes the display
+            if time.monotonic() - self.last_open_attempt >= DB_RETRY_SECONDS:
+                self.last_open_attempt = time.monotonic()
+                self.board.open_in_background()
+            return
+        self.offline_label.setVisible(False)
+
+        with self.board.display_connection() as conn:
+            # New tasks are picked up from SQLite by this timer, so the web interface needs no queue to signal them
+            # Get new tasks from SQLite (include timestamp) — only non-completed ones
+            cursor = conn.execute('SELECT name, priority, timestamp FROM tasks WHERE displayed = 0 AND completed = 0')
+            new_tasks = [{'name': row[0], 'priority': row[1], 'timestamp': row[2]} for row in cursor]
+
+            # Mark tasks as displayed (use timestamp to target specific rows)
+            for task in new_tasks:
+                if task.get('timestamp'):
+                    conn.execute('UPDATE tasks SET displayed = 1 WHERE name = ? AND priority = ? AND timestamp = ?', (task['name'], task['priority'], task['timestamp']))
+                else:
+                    conn.execute('UPDATE tasks SET displayed = 1 WHERE name = ? AND priority = ?', (task['name'], task['priority']))
+            conn.commit()
+
+            # Get all active (non-completed) tasks for sorting (include timestamp)
+            cursor = conn.execute('SELECT name, priority, timestamp FROM tasks WHERE completed = 0')
+            all_tasks = []
+            for row in cursor:
+                name, priority, ts = row[0], row[1], row[2]
+                ts_short = ''
+                if ts:
+                    try:
+                        dt = datetime.datetime.fromisoformat(ts)
+                        ts_short = f"[{dt.strftime('%d/%m/%y %I:%M %p')}]"
+                    except Exception:
+                        ts_short = f"[{ts}]"
+                all_tasks.append({'name': name, 'priority': priority, 'timestamp': ts, 'timestamp_short': ts_short})
+
+        # Sort tasks by priority (High > Medium > Low) and then by name
+        all_tasks.sort(key=lambda x: (-PRIORITY_ORDER[x['priority']], x['name']))
+
+        # Only redraw (and re-cache) when the task list actually changed
+        if all_tasks != self.shown_tasks:
+            self.render_tasks(all_tasks)
+            self.board.save_display_cache(all_tasks)
+
+    def render_tasks(self, tasks):
+        # Update display with colored priorities and increased spacing
+        self.shown_tasks = tasks
+        self.text_area.clear()
+        for task in tasks:
+            color = PRIORITY_COLORS.get(task['priority'], '#000')
+            name_escaped = html.escape(task['name'])
+            ts_display = html.escape(task.get('timestamp_short', ''))
+            item_html = (f"<div style='margin-bottom:20px; line-height:1.5;'>"
+                         f"<div style='color:#666; font-size:{TIMESTAMP_FONT_SIZE}px; margin-bottom:30px;'>{ts_display}</div>"
+                         f"<span style='color:{color}; font-weight:700; margin-right:15px;'>{task['priority']}:</span>"
+                         f"<span style='color:#222;'>{name_escaped}</span>"
+                         f"</div>")
+            self.text_area.append(item_html)
+
+    def paintEvent(self, event):
+        super().paintEvent(event)
+        if not self.painted:
+            self.painted = True
+            startup_mark('first_paint')
+            self.first_painted.emit()
+
+    def update_tunnel_status(self):
+        status = tunnel.snapshot()
+        color = TUNNEL_STATUS_COLORS.get(status['status'], '#666')
+        text = f"Remote entry: {status['status']}"
+        if status['url']:
+            text += f" - {status['url']}"
+        elif status['retry_in'] is not None:
+            text += f" (retrying in {status['retry_in']}s)"
+        self.tunnel_label.setText(text)
+        self.tunnel_label.setStyleSheet(f"QLabel {{ color: {color}; padding: 2px; }}")
+
+    def clear_tasks(self):
+        self.text_area.clear()
+        # Only clear active tasks; preserve completed/history
+        with self.board.display_connection() as conn:
+            conn.execute('DELETE FROM tasks WHERE completed = 0')
+            conn.commit()
+
+    def show_history_dialog(self):
+        # Open a dialog that lists completed tasks
+        dialog = QtWidgets.QDialog(self)
+        dialog.setWindowTitle(f'Completed Tasks ({self.board.name})' if len(BOARDS) > 1 else 'Completed Tasks')
+        dialog.resize(2000, 1200)
+        dlg_layout = QtWidgets.QVBoxLayout(dialog)
+        text = QtWidgets.QTextEdit(dialog)
+        
+        # Configure text widget
+        text.setReadOnly(True)
+        text.setAcceptRichText(True)
+        font = QtGui.QFont("Arial", COMPLETED_TASKS_FONT_SIZE)
+        text.setFont(font)
+
+        # Fetch completed tasks with explicit column names
+        with self.board.display_connection() as conn:
+            cursor = conn.execute('''
+                SELECT 
+                    name,
+                    priority,
+                    timestamp,
+                    completed_at,
+                    confirm_number
+                FROM tasks 
+                WHERE completed = 1 
+                ORDER BY completed_at DESC
+            ''')
+
+            # Debug print column names
+            print("Debug - Column names:", [description[0] for description in cursor.description])
+
+            rows = cursor.fetchall()
+
+        lines = []
+        for row in rows:
+            try:
+                name = str(row[0] if row[0] is not None else '')
+                priority = str(row[1] if row[1] is not None else '')
+                ts = row[2]
+                completed_at = row[3]
+                confirm_number = row[4]
+                
+                # Debug print for each row
+                print(f"Debug - Row data: name='{name}', priority='{priority}', confirm_number={confirm_number}")
+                
+                created = ''
+                completed = ''
+            except Exception as e:
+                print(f"Error processing row: {e}")
+                continue
+            if ts:
+                try:
+                    dt = datetime.datetime.fromisoformat(ts)
+                    created = f"[{dt.strftime('%d/%m/%y %I:%M %p')}]"
+                except Exception:
+                    created = f"[{ts}]"
+            if completed_at:
+                try:
+                    dt2 = datetime.datetime.fromisoformat(completed_at)
+                    completed = f"[{dt2.strftime('%d/%m/%y %I:%M %p')}]"
+                except Exception:
+                    completed = f"[{completed_at}]"
+                
+            # Debug print to check the values
+            print(f"Debug - name: {name}, priority: {priority}, confirm_number: {confirm_number}")
+            
+            # Format each task with HTML for colors and spacing
+            task_html = (
+                f'<div style="margin-bottom: 20px; line-height: 1.8;">'
+                f'<span style="color: #2196F3; white-space: nowrap;">{created}</span>&nbsp;&nbsp;'  # Blue for creation time
+                f'<span style="color: #4CAF50; white-space: nowrap;">{completed}</span>'  # Green for completion time
+                f'{"&nbsp;&nbsp;" if confirm_number else ""}'
+                f'<span style="color: #ff1744; font-weight: bold; white-space: nowrap;">#{confirm_number}</span>&nbsp;&nbsp;'  # Red confirmation number
+                f'<span style="font-weight: bold; color: #333;">{priority}:</span>&nbsp;'  # Priority label
+                f'<span style="color: #222;">{html.escape(str(name))}</span>'  # Task name
+                f'</div>'
+            )
+            lines.append(task_html)
+
+        # Set content
+        text.setHtml(''.join(lines) if lines else '<p>No completed tasks yet.</p>')
+        dlg_layout.addWidget(text)
+        
+        # Close button with styling
+        close_btn = QtWidgets.QPushButton('Close', dialog)
+        close_btn.setStyleSheet("""
+            QPushButton {
+                background-color: #f0f0f0;
+                border: 1px solid #ccc;
+                border-radius: 4px;
+                padding: 8px 16px;
+                color: #333;
+                font-size: 14px;
+            }
+            QPushButton:hover {
+                background-color: #e0e0e0;
+            }
+            QPushButton:pressed {
+                background-color: #d0d0d0;
+            }
+        """)
+        close_btn.clicked.connect(dialog.accept)
+        dlg_layout.addWidget(close_btn)
+        
+        # Set dialog styling
+        dialog.setStyleSheet("""
+            QDialog {
+                background-color: #ffffff;
+            }
+        """)
+        
+        dialog.exec_()
@@ -0,0 +1,152 @@
+# Cloudflare Tunnel supervisor for remote task entry
+# Only uses the standard library, so it can be imported by the display without loading Flask
+
+import re, subprocess, time, threading
+import urllib.request
+from TD_common import (logger, flask_ready, CLOUDFLARED_PATH, FLASK_PORT,
+                       TUNNEL_BACKOFF_MIN, TUNNEL_BACKOFF_MAX, TUNNEL_STABLE_AFTER,
+                       TUNNEL_HEALTH_INTERVAL, TUNNEL_HEALTH_GRACE, TUNNEL_HEALTH_FAILURES)
+
+
+class TunnelSupervisor:
+    """Runs cloudflared, captures its public URL and restarts it with exponential backoff when it dies or stops answering."""
+
+    URL_PATTERN = re.compile(r'https://(?!api\.)[-a-z0-9]+\.trycloudflare\.com')
+
+    def __init__(self, cloudflared_path, local_url, ready_event):
+        self.cloudflared_path = cloudflared_path
+        self.local_url = local_url
+        self.ready_event = ready_event
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._process = None
+        self._terminate_reason = None
+        self._status = 'waiting'
+        self._url = None
+        self._restarts = 0
+        self._last_error = None
+        self._retry_at = None
+        self._started_at = None
+
+    def start(self):
+        threading.Thread(target=self._supervise, name='cloudflared-supervisor', daemon=True).start()
+
+    def stop(self):
+        self._stop_event.set()
+        self._set(status='stopped', url=None, retry_at=None)
+        process = self._process
+        if process and process.poll() is None:
+            process.terminate()
+
+    def snapshot(self):
+        # Thread-safe copy of the current state for the display and the /tunnel endpoint
+        with self._lock:
+            retry_in = None
+            if self._retry_at is not None:
+                retry_in = max(0, round(self._retry_at - time.monotonic()))
+            uptime = None
+            if self._started_at is not None:
+                uptime = round(time.monotonic() - self._started_at)
+            return {
+                'status': self._status,
+                'url': self._url,
+                'restarts': self._restarts,
+                'last_error': self._last_error,
+                'retry_in': retry_in,
+                'uptime': uptime,
+            }
+
+    def _set(self, **fields):
+        with self._lock:
+            for key, value in fields.items():
+                setattr(self, '_' + key, value)
+
+    def _supervise(self):
+        self.ready_event.wait()
+        logger.info("Flask is ready, starting public tunnel...")
+        backoff = TUNNEL_BACKOFF_MIN
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            self._run_once()
+            if self._stop_event.is_set():
+                break
+            # A tunnel that ran for a while failed for a new reason, so start the backoff over
+            if time.monotonic() - started >= TUNNEL_STABLE_AFTER:
+                backoff = TUNNEL_BACKOFF_MIN
+            logger.warning(f"cloudflared exited, restarting in {backoff}s")
+            with self._lock:
+                self._status = 'restarting'
+                self._url = None
+                self._started_at = None
+                self._restarts += 1
+                self._retry_at = time.monotonic() + backoff
+            self._stop_event.wait(backoff)
+            backoff = min(backoff * 2, TUNNEL_BACKOFF_MAX)
+
+    def _run_once(self):
+        try:
+            process = subprocess.Popen(
+                [self.cloudflared_path, 'tunnel', '--url', self.local_url],
+                stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                text=True, errors='replace', bufsize=1)
+        except OSError as e:
+            logger.error(f"Failed to start cloudflared: {e}")
+            self._set(last_error=str(e))
+            return
+        self._process = process
+        self._terminate_reason = None
+        self._set(status='starting', retry_at=None, started_at=time.monotonic())
+        threading.Thread(target=self._health_check, args=(process,), name='cloudflared-health', daemon=True).start()
+
+        # cloudflared logs everything (including the public URL) to stderr, which is merged into stdout here.
+        # Pass it on to the terminal so the operator can see why a tunnel fails.
+        last_line = ''
+        for line in process.stdout:
+            line = line.rstrip()
+            if not line:
+                continue
+            last_line = line
+            logger.info(f"cloudflared: {line}")
+            match = self.URL_PATTERN.search(line)
+            if match and match.group(0) != self.snapshot()['url']:
+                # Stays 'starting' until the first health check through the URL has passed
+                logger.info(f"Public tunnel URL: {match.group(0)}")
+                self._set(url=match.group(0))
+        code = process.wait()
+        if self._stop_event.is_set():
+            return
+        if self._terminate_reason:
+            self._set(last_error=self._terminate_reason)
+        else:
+            self._set(last_error=f"cloudflared exited with code {code}: {last_line}" if last_line else f"cloudflared exited with code {code}")
+
+    def _health_check(self, process):
+        # Fetch /healthz through the public URL, kill cloudflared if it stops answering so it gets restarted
+        if self._stop_event.wait(TUNNEL_HEALTH_GRACE):
+            return
+        failures = 0
+        while process.poll() is None and not self._stop_event.is_set():
+            url = self.snapshot()['url']
+            if not url:
+                # cloudflared is running but never handed out a public URL, so restart it
+                logger.warning(f"cloudflared printed no public URL within {TUNNEL_HEALTH_GRACE}s, restarting it")
+                self._terminate_reason = f"no public URL within {TUNNEL_HEALTH_GRACE}s"
+                process.terminate()
+                return
+            try:
+                with urllib.request.urlopen(url + '/healthz', timeout=5) as response:
+                    response.read()
+                failures = 0
+                self._set(status='online')
+            except Exception as e:
+                failures += 1
+                logger.warning(f"Tunnel health check failed ({failures}/{TUNNEL_HEALTH_FAILURES}): {e}")
+                if failures >= TUNNEL_HEALTH_FAILURES:
+                    self._terminate_reason = f"health check failed: {e}"
+                    process.terminate()
+                    return
+            if self._stop_event.wait(TUNNEL_HEALTH_INTERVAL):
+                return
+
+
+tunnel = TunnelSupervisor(CLOUDFLARED_PATH, f'http://localhost:{FLASK_PORT}', flask_ready)
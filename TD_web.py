@@ -0,0 +1,354 @@
+# Flask web interface for remote task entry and management
+# Imported lazily by the main script, only in the modes that run the server
+
+import datetime
+from flask import Flask, Blueprint, request, render_template_string, jsonify, g, abort
+from werkzeug.serving import make_server
+from TD_completed_list_template import COMPLETED_LIST
+from TD_common import (logger, get_board, flask_ready, startup_mark,
+                       BOARDS, PRIORITY_ORDER, TIMESTAMP_FONT_SIZE, FLASK_PORT)
+from TD_tunnel import tunnel
+
+# Flask app for remote input and task management
+app = Flask(__name__)
+
+# Task pages of one board, registered once at "/" for the default board and once at "/b/<board>" for every board
+board_pages = Blueprint('board_pages', __name__)
+
+# HTML form for task submission
+INPUT_FORM = '''
+<!doctype html>
+<html>
+<head>
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>Add Task{% if board_label %} - {{ board_label }}{% endif %}</title>
+    <style>
+        :root{ --bg:#f7f8fb; --card:#ffffff; --accent:#1976d2; --muted:#6b6f76 }
+        *{box-sizing:border-box}
+        body{margin:0;font-family:system-ui,-apple-system,Segoe UI,Roboto,Arial;background:var(--bg);padding:16px}
+        .wrap{max-width:720px;margin:0 auto}
+        .card{background:var(--card);border-radius:12px;padding:18px;box-shadow:0 6px 18px rgba(20,20,30,0.06)}
+        h1{margin:0 0 12px;font-size:20px;color:#222;text-align:center}
+        form{display:flex;flex-direction:column;gap:12px}
+        label{font-size:13px;color:var(--muted)}
+        input[type=text],select,input[type=number]{width:100%;padding:12px;border-radius:8px;border:1px solid #e6e9ef;font-size:15px}
+        input[type=text]:focus,select:focus,input[type=number]:focus{outline:none;border-color:var(--accent)}
+        .row{display:flex;gap:8px}
+        .btn{width:100%;padding:12px;border-radius:8px;border:none;background:var(--accent);color:#fff;font-weight:600;cursor:pointer}
+        .secondary{background:var(--accent);color:#fff}
+        .message{margin-top:12px;padding:10px;border-radius:8px;text-align:center}
+        @media(min-width:520px){.row{flex-direction:row}.two{flex:1}}
+    </style>
+</head>
+<body>
+    <div class="wrap">
+        <div class="card">
+            <h1>Add a New Task{% if board_label %} ({{ board_label }}){% endif %}</h1>
+            <form method="post" action="{{ base }}/">
+                <div>
+                    <label for="task_name">Task</label>
+                    <input id="task_name" type="text" name="task_name" placeholder="Describe the task" required maxlength="1000">
+                </div>
+                <div class="row">
+                    <div class="two">
+                        <label for="priority">Priority</label>
+                        <select id="priority" name="priority" required>
+                            <option value="" disabled selected>Choose priority</option>
+                            <option value="High">High</option>
+                            <option value="Medium">Medium</option>
+                            <option value="Low">Low</option>
+                        </select>
+                    </div>
+                </div>
+                <button class="btn" type="submit">Add Task</button>
+            </form>
+            <a href="{{ base }}/tasks" style="display:block;margin-top:10px;text-decoration:none"><button class="btn secondary">View Tasks</button></a>
+            {% if message %}
+                <div class="message {% if 'successfully' in message %}success{% else %}error{% endif %}">{{ message }}</div>
+            {% endif %}
+        </div>
+    </div>
+</body>
+</html>
+'''
+
+# HTML for task list with delete buttons
+TASK_LIST = '''
+<!doctype html>
+<html>
+<head>
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <title>Tasks{% if board_label %} - {{ board_label }}{% endif %}</title>
+    <style>
+        :root{--bg:#f7f8fb;--card:#fff;--accent:#1976d2;--muted:#6b6f76}
+        *{box-sizing:border-box}
+    body{margin:0;font-family:system-ui,-apple-system,Segoe UI,Roboto,Arial;background:var(--bg);padding:14px;overflow-x:hidden;-webkit-overflow-scrolling:touch}
+    .wrap{max-width:780px;width:100%;margin:0 auto;padding:0 8px}
+    header{display:flex;align-items:center;gap:12px;margin-bottom:14px}
+    h1{margin:0;font-size:18px;color:#222}
+    .card{background:var(--card);padding:12px;border-radius:10px;box-shadow:0 6px 18px rgba(20,20,30,0.04);overflow:hidden}
+        ul{list-style:none;padding:0;margin:0;display:flex;flex-direction:column;gap:12px}
+        li{display:flex;flex-direction:column;gap:8px;padding:12px;border-radius:10px;border:1px solid #eef2f7;background:var(--card)}
+        .meta{display:flex;flex-direction:column;width:100%}
+        .ts{color:var(--muted);font-size:12px;margin-bottom:2px}
+        .title{display:flex;gap:8px;align-items:flex-start;width:100%}
+        .priority{font-weight:700;color:#222;white-space:nowrap}
+    .name{color:#222;overflow-wrap:anywhere;word-break:break-word;white-space:normal;line-height:1.4;flex:1}
+        form{display:flex;gap:8px;align-items:center;width:100%;padding-top:4px}
+        input[type=number],input[type=text]{padding:8px;border-radius:8px;border:1px solid #e2e6ef;width:80px}
+        .btn{padding:8px 12px;border-radius:8px;border:none;background:var(--accent);color:#fff;cursor:pointer}
+        .link-btn{background:var(--accent);color:#fff}
+        @media(max-width:480px){.ts{font-size:12px}.btn{padding:8px 10px}}
+    </style>
+</head>
+<body>
+    <div class="wrap">
+            <header>
+                <a href="{{ base }}/" style="text-decoration:none;margin-right:8px"><button class="btn link-btn">Back</button></a>
+                <h1 style="margin:0">Tasks{% if board_label %} ({{ board_label }}){% endif %}</h1>
+                <div style="margin-left:auto"><a href="{{ base }}/history" style="text-decoration:none"><button class="btn link-btn">View Completed</button></a></div>
+            </header>
+        <div class="card">
+            {% if tasks %}
+                <ul>
+                    {% for task in tasks %}
+                        <li>
+                            <div class="meta">
+                                                <div class="ts"><span style="font-size:11px">{{ task.timestamp_short }}</span></div>
+                                <div class="title"><div class="priority">{{ task.priority }}:</div><div class="name">{{ task.name }}</div></div>
+                            </div>
+                            <form method="post" action="{{ base }}/move_task">
+                                <input type="hidden" name="name" value="{{ task.name }}">
+                                <input type="hidden" name="priority" value="{{ task.priority }}">
+                                <input type="hidden" name="timestamp" value="{{ task.timestamp }}">
+                                <input type="text" name="confirm_number" required placeholder="#" style="width:84px" min="0">
+                                <button class="btn" type="submit">Complete</button>
+                            </form>
+                        </li>
+                    {% endfor %}
+                </ul>
+            {% else %}
+                <p style="margin:12px 0;color:var(--muted)">No tasks available.</p>
+            {% endif %}
+            <!-- Back button moved to header -->
+        </div>
+    </div>
+</body>
+</html>
+'''
+
+@board_pages.url_value_preprocessor
+def pull_board(endpoint, values):
+    # Pick the board from the URL ("/b/<board>/..."), the old URLs without a board use the default one
+    name = values.pop('board', None) if values else None
+    g.board = get_board(name)
+    if g.board is None:
+        abort(404)
+    g.base = f'/b/{g.board.name}' if name else ''
+    # Only name the board on the pages when there is more than one
+    g.board_label = g.board.name if len(BOARDS) > 1 else ''
+
+
+@board_pages.before_request
+def borrow_connection():
+    g.conn = g.board.acquire()
+
+
+@board_pages.teardown_request
+def return_connection(exc):
+    conn = g.pop('conn', None)
+    if conn is not None:
+        if exc is not None:
+            conn.rollback()
+        g.board.release(conn)
+
+@board_pages.route('/', methods=['GET', 'POST'])
+def handle_input():
+    conn = g.conn
+    message = ''
+    if request.method == 'POST':
+        task_name = request.form.get('task_name')
+        priority = request.form.get('priority')
+        if task_name and priority in PRIORITY_ORDER:
+            if len(task_name) <= 1000:  # Basic input validation
+                # timestamp for the task (ISO format stored)
+                ts = datetime.datetime.now().isoformat()
+                conn.execute('INSERT INTO tasks (name, priority, displayed, timestamp) VALUES (?, ?, 0, ?)', (task_name, priority, ts))
+                conn.commit()
+                message = 'Task submitted successfully!'
+            else:
+                message = 'Task name too long (max 1000 characters).'
+        else:
+            message = 'Please provide a valid task name and priority.'
+    return render_template_string(INPUT_FORM, message=message, base=g.base, board_label=g.board_label)
+
+@board_pages.route('/tasks')
+def show_tasks():
+    conn = g.conn
+    try:
+        # Only show active (not moved/completed) tasks on the main task list
+        cursor = conn.execute('''
+            SELECT name, priority, timestamp 
+            FROM tasks 
+            WHERE completed = 0 OR completed IS NULL
+            ORDER BY priority DESC, name
+        ''')
+        tasks = []
+        for row in cursor:
+            name, priority, ts = row[0], row[1], row[2]
+            # Format short timestamp for display (dd/mm/yy hh:MM AM/PM) and wrap in brackets
+            ts_short = ''
+            if ts:
+                try:
+                    dt = datetime.datetime.fromisoformat(ts)
+                    ts_short = f"[{dt.strftime('%d/%m/%y %I:%M %p')}]"
+                except Exception:
+                    ts_short = f"[{ts}]"
+            tasks.append({'name': name, 'priority': priority, 'timestamp': ts, 'timestamp_short': ts_short})
+    except Exception as e:
+        logger.error(f"Failed to fetch tasks: {e}")
+        return f'<script>alert("Failed to load tasks"); window.location="{g.base}/"</script>'
+    tasks.sort(key=lambda x: (-PRIORITY_ORDER[x['priority']], x['name']))
+    # Inject the timestamp font size into the template CSS (simple replace placeholder)
+    template = TASK_LIST.replace('font-size:12px', f'font-size:{TIMESTAMP_FONT_SIZE}px')
+    return render_template_string(template, tasks=tasks, base=g.base, board_label=g.board_label)
+
+@board_pages.route('/delete_task', methods=['POST'])
+def delete_task():
+    # Keep for backward compatibility but do not expose it in the UI.
+    conn = g.conn
+    name = request.form.get('name')
+    priority = request.form.get('priority')
+    timestamp = request.form.get('timestamp')
+    if name and priority:
+        if timestamp:
+            conn.execute('DELETE FROM tasks WHERE name = ? AND priority = ? AND timestamp = ?', (name, priority, timestamp))
+        else:
+            conn.execute('DELETE FROM tasks WHERE name = ? AND priority = ?', (name, priority))
+        conn.commit()
+    return f'<script>window.location="{g.base}/tasks"</script>'
+
+
+@board_pages.route('/move_task', methods=['POST'])
+def move_task():
+    # Archive/complete a task by moving it to history
+    conn = g.conn
+    name = request.form.get('name')
+    priority = request.form.get('priority')
+    timestamp = request.form.get('timestamp')
+    confirm_number = request.form.get('confirm_number')
+    
+    # Validate required fields
+    if not all([name, priority, confirm_number]):
+        return f'<script>alert("Please fill in all required fields including the confirmation number"); window.location="{g.base}/tasks"</script>'
+    
+    # In case the confirmation number is only supposed to be numeric, uncomment below and change line 142 input type to number
+    
+    #try:
+        # Convert confirmation number to int (validates it's a proper number)
+    #    confirm_number = int(confirm_number)
+    #except ValueError:
+    #    return '<script>alert("Please enter a valid number"); window.location="/tasks"</script>'
+    
+    completed_ts = datetime.datetime.now().isoformat()
+    
+    try:
+        # First verify the task exists and isn't already completed
+        if timestamp:
+            cursor = conn.execute('''SELECT 1 FROM tasks 
+                                   WHERE name = ? AND priority = ? AND timestamp = ? AND completed = 0''',
+                                (name, priority, timestamp))
+        else:
+            cursor = conn.execute('''SELECT 1 FROM tasks 
+                                   WHERE name = ? AND priority = ? AND completed = 0''',
+                                (name, priority))
+        
+        if not cursor.fetchone():
+            return f'<script>alert("Task not found or already completed"); window.location="{g.base}/tasks"</script>'
+        
+        # Move the task to history
+        if timestamp:
+            cursor = conn.execute('''UPDATE tasks 
+                          SET completed = 1, completed_at = ?, confirm_number = ? 
+                          WHERE name = ? AND priority = ? AND timestamp = ? AND completed = 0''', 
+                       (completed_ts, confirm_number, name, priority, timestamp))
+        else:
+            cursor = conn.execute('''UPDATE tasks 
+                          SET completed = 1, completed_at = ?, confirm_number = ? 
+                          WHERE name = ? AND priority = ? AND completed = 0''', 
+                       (completed_ts, confirm_number, name, priority))
+        
+        # Rows changed by this UPDATE (total_changes counts everything the pooled connection ever did)
+        affected = cursor.rowcount
+        conn.commit()
+        
+        if affected == 0:
+            return f'<script>alert("No task was updated. It may have been already completed."); window.location="{g.base}/tasks"</script>'
+            
+    except Exception as e:
+        logger.error(f"Failed to move task to history: {e}")
+        conn.rollback()
+        return f'<script>alert("Failed to move task to history"); window.location="{g.base}/tasks"</script>'
+            
+    return f'<script>window.location="{g.base}/tasks"</script>'
+
+
+@board_pages.route('/history')
+def history():
+    conn = g.conn
+    cursor = conn.execute('SELECT name, priority, timestamp, completed_at, confirm_number FROM tasks WHERE completed = 1 ORDER BY completed_at DESC')
+    tasks = []
+    for row in cursor:
+        name, priority, ts, completed_at, confirm_number = row[0], row[1], row[2], row[3], row[4]
+        ts_short = ''
+        completed_short = ''
+        if ts:
+            try:
+                dt = datetime.datetime.fromisoformat(ts)
+                ts_short = f"[{dt.strftime('%d/%m/%y %H:%M')}]"
+            except Exception:
+                ts_short = f"[{ts}]"
+        if completed_at:
+            try:
+                dt2 = datetime.datetime.fromisoformat(completed_at)
+                completed_short = f"[{dt2.strftime('%d/%m/%y %H:%M')}]"
+            except Exception:
+                completed_short = f"[{completed_at}]"
+        tasks.append({'name': name, 'priority': priority, 'timestamp_short': ts_short, 'completed_short': completed_short, 'confirm_number': confirm_number})
+    template = COMPLETED_LIST.replace('font-size:12px', f'font-size:{TIMESTAMP_FONT_SIZE}px')
+    return render_template_string(template, tasks=tasks, base=g.base, board_label=g.board_label)
+
+
+app.register_blueprint(board_pages)
+app.register_blueprint(board_pages, url_prefix='/b/<board>', name='board_pages_by_name')
+
+
+@app.route('/healthz')
+def healthz():
+    # Cheap endpoint the tunnel supervisor fetches through the public URL
+    return 'ok'
+
+
+@app.route('/tunnel')
+def tunnel_status():
+    # Tunnel status and public URL, only answered on the host itself.
+    # Requests coming in through the tunnel also arrive from localhost, cloudflared marks them with Cf-Connecting-IP.
+    if request.remote_addr not in ('127.0.0.1', '::1') or request.headers.get('Cf-Connecting-IP'):
+        return 'Not found', 404
+    return jsonify(tunnel.snapshot())
+
+# Run Flask in a thread
+def run_flask():
+    try:
+        # Open the default board's database before accepting requests
+        get_board().open()
+        logger.info(f"Starting Flask on http://0.0.0.0:{FLASK_PORT}")
+        # Bind first, then signal, so the tunnel starts the moment the port is open
+        server = make_server('0.0.0.0', FLASK_PORT, app, threaded=True)
+        flask_ready.set()
+        startup_mark('flask_bound')
+        server.serve_forever()
+    except Exception as e:
+        logger.error(f"Flask failed to start: {e}")
+        import traceback
+        traceback.print_exc()